@@ -6,8 +6,10 @@
 import asyncio
 import json
 import re
+import time
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import lru_cache
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 from autogen_agentchat.agents import AssistantAgent
 from autogen_agentchat.messages import TextMessage
@@ -21,6 +23,496 @@ from mcp_server.tools import analyze_data_pandas, generate_and_execute_sql
 
 from utils.model_manager import model_manager
 
+_BANNER = "=" * 60
+
+# ============================================================
+# PRECOMPILED PATTERNS - Message cleanup
+# ============================================================
+
+# content='...' / content="..." values inside TextMessage reprs
+_CONTENT_FIELD_RE = re.compile(r"content=['\"]([^'\"]+(?:['\"]['\"][^'\"]+)*?)['\"]")
+
+# Wrapper / metadata noise removed in a single pass
+_WRAPPER_NOISE_RE = re.compile(
+    r"TextMessage\([^)]+\)"
+    r"|^\[|\]$"
+    r"|models_usage\s*=\s*\w+"
+    r"|metadata\s*=\s*\{[^}]*\}"
+    r"|source\s*=\s*[\"'][^\"']+[\"']"
+)
+
+# Runs of whitespace and commas collapse to one space
+_SEPARATOR_RE = re.compile(r"[\s,]+")
+
+_MESSAGES_PREFIX_RE = re.compile(r"^messages\s*=\s*")
+
+# First content='...' field of a TextMessage repr
+_STREAM_CONTENT_RE = re.compile(r"content=['\"]([^'\"]+)['\"]")
+
+# [NEED_USER_INPUT: question] marker emitted by agents that need the user
+_NEED_USER_INPUT_RE = re.compile(r"\[NEED_USER_INPUT:\s*(.+?)\]")
+
+# Last-resort unwrap when a TextMessage wrapper survives cleaning
+_DEEP_CLEAN_RE = re.compile(r'.*content=["\']([^"\']+)["\'].*')
+
+
+def _unwrap_content(raw_content: Any) -> Optional[str]:
+    """
+    Walk TaskResult / message / list shells down to the last string content
+
+    Returns None when no string leaf is reachable.
+    """
+    _isinstance = isinstance
+    cur = raw_content
+    while True:
+        if _isinstance(cur, str):
+            return cur
+        if _isinstance(cur, (list, tuple)):
+            if not cur:
+                return None
+            cur = cur[-1]
+            continue
+        if _isinstance(cur, dict):
+            if "content" not in cur:
+                return None
+            cur = cur["content"]
+            continue
+        messages = getattr(cur, "messages", None)
+        if messages:
+            cur = messages[-1]
+            continue
+        content = getattr(cur, "content", None)
+        if content is None:
+            return None
+        cur = content
+
+
+# ============================================================
+# PRECOMPILED PATTERNS - Message visibility filter
+# ============================================================
+
+_TEXTMESSAGE_CALL_RE = re.compile(r"textmessage\(", re.IGNORECASE)
+_TEXTMESSAGE_RE = re.compile(r"textmessage", re.IGNORECASE)
+_CONTENT_KW_RE = re.compile(r"content=", re.IGNORECASE)
+_MODELS_USAGE_RE = re.compile(r"models_usage", re.IGNORECASE)
+_METADATA_KW_RE = re.compile(r"metadata", re.IGNORECASE)
+_FINAL_INDICATOR_RE = re.compile(
+    r"final|answer|result|here is|here are|completed|summary|conclusion",
+    re.IGNORECASE,
+)
+_PLANNING_INDICATOR_RE = re.compile(
+    r"we are working|to answer this|here is an initial|fact sheet"
+    r"|assembled the following|team:",
+    re.IGNORECASE,
+)
+
+# ============================================================
+# PRECOMPILED PATTERNS - Message type classification
+# ============================================================
+
+# One pass over the content finds every keyword class present. The
+# lookahead lets overlapping keywords all report; lastgroup names the class.
+_MESSAGE_KEYWORDS_RE = re.compile(
+    r"(?=(?:"
+    r"(?P<select>select)"
+    r"|(?P<from>from)"
+    r"|(?P<tool>calling|executing)"
+    r"|(?P<validation>approved)"
+    r"|(?P<analysis>statistic)"
+    r"|(?P<thinking>i will|let me|first)"
+    r"|(?P<error>error|failed)"
+    r"))",
+    re.IGNORECASE,
+)
+
+
+@lru_cache(maxsize=64)
+def _agent_kind(agent: str) -> Optional[str]:
+    """Message type implied by the agent's name - agent names are a small set"""
+
+    agent_lower = agent.lower()
+    if "validation" in agent_lower:
+        return "validation"
+    if "analysis" in agent_lower:
+        return "analysis"
+    return None
+
+
+# ============================================================
+# STREAM BUFFERING
+# ============================================================
+
+_STREAM_END = object()
+
+
+async def _prefetch(
+    source: AsyncIterator[Any], maxsize: int = 32
+) -> AsyncIterator[Any]:
+    """
+    Drain an async iterator from a background task into a queue
+
+    Lets the agent team keep producing while the consumer is still
+    cleaning / sending earlier messages. Producer errors are re-raised
+    in the consumer; closing the consumer cancels the producer.
+    maxsize=0 makes the queue unbounded so a slow consumer never stalls
+    the producer.
+    """
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+    consumer_closed = False
+
+    async def produce():
+        try:
+            async for item in source:
+                await queue.put(item)
+            await queue.put(_STREAM_END)
+        except BaseException as e:
+            # Forward everything - including a CancelledError raised inside the
+            # source - so the consumer is never left waiting on an empty queue.
+            # Only skip it when the consumer itself cancelled us on the way out.
+            if not consumer_closed:
+                await queue.put(e)
+
+    producer = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _STREAM_END:
+                break
+            if isinstance(item, BaseException):
+                raise item
+            yield item
+    finally:
+        consumer_closed = True
+        producer.cancel()
+
+
+# ============================================================
+# CONCURRENCY LIMIT
+# ============================================================
+
+# Caps team runs across all requests in the process so concurrent users
+# queue here instead of piling onto the model server
+_AGENT_SLOTS = asyncio.Semaphore(settings.max_concurrent_agents)
+
+
+# Caps schema lookups in flight (each holds a pyodbc connection in a worker
+# thread) across every tool call, not just within one batch
+_SCHEMA_SLOTS = asyncio.Semaphore(8)
+
+
+async def _limited(source: AsyncIterator[Any]) -> AsyncIterator[Any]:
+    """
+    Hold an agent slot for as long as source is being drained
+
+    Pair with an unbounded _prefetch so the slot is released when the team's
+    run finishes, not when a slow SSE consumer finishes reading it.
+    """
+
+    async with _AGENT_SLOTS:
+        async for item in source:
+            yield item
+
+
+# ============================================================
+# TEAM POOL
+# ============================================================
+
+# Idle teams keyed by (team name, model). Shared by every orchestrator in
+# the process, since the API builds a new orchestrator per request. A team
+# is checked out for one task at a time, so concurrent requests never
+# share a running team. Size and age bounds come from settings.
+_TEAM_POOL: Dict[Tuple[str, str], List[Tuple[float, MagenticOneGroupChat]]] = {}
+
+
+def _evict_idle_teams(now: float):
+    """Drop pooled teams that have sat idle longer than the TTL"""
+
+    cutoff = now - settings.team_pool_idle_ttl_seconds
+    for key in list(_TEAM_POOL):
+        fresh = [entry for entry in _TEAM_POOL[key] if entry[0] >= cutoff]
+        if fresh:
+            _TEAM_POOL[key] = fresh
+        else:
+            del _TEAM_POOL[key]
+
+
+# ============================================================
+# EVENT TIMESTAMPS
+# ============================================================
+
+# (epoch second, isoformat string) - display timestamps only need
+# one-second resolution, so isoformat() runs at most once per second
+_ts_cache = [0, ""]
+
+
+def _event_timestamp() -> str:
+    """Return an ISO timestamp for stream events, cached per second"""
+
+    second = int(time.time())
+    if second != _ts_cache[0]:
+        _ts_cache[0] = second
+        _ts_cache[1] = datetime.fromtimestamp(second).isoformat()
+    return _ts_cache[1]
+
+
+# ============================================================
+# ROUTING FAST PATHS
+# ============================================================
+
+# Greetings / acknowledgements that never need the data team
+_TRIVIAL_GENERAL = frozenset(
+    {"hi", "hello", "hey", "thanks", "thank you", "ok", "okay"}
+)
+
+# Raw SQL pasted by the user always goes to the data team. Match real statement
+# shapes (SELECT <columns> FROM / WITH name AS ( ...) so English sentences that
+# merely start with "select" or "with" keep going through the normal tiers
+_RAW_SQL_RE = re.compile(
+    r"select\s+(?:distinct\s+)?(?:top\s+\d+\s+)?"
+    r"(?:\*|[\w\[\].]+(?:\s*,\s*[\w\[\].]+)*)\s+from\s"
+    r"|with\s+\w+(?:\s*\([^)]*\))?\s+as\s*\("
+)
+
+# TIER 1: Strong database/data indicators. Matched as substrings on purpose:
+# "customer" must still hit DimCustomer, "sales" SalesAmount, "revenue" revenues
+_DATA_INDICATORS_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
+                # Action verbs
+                "show",
+                "list",
+                "display",
+                "get",
+                "fetch",
+                "find",
+                "retrieve",
+                "analyze",
+                "compare",
+                "calculate from",
+                "query",
+                # Question starters
+                "how many",
+                "what are",
+                "which",
+                "who are",
+                # Database terms
+                "table",
+                "database",
+                "sql",
+                "data",
+                # Business entities
+                "sales",
+                "customer",
+                "product",
+                "order",
+                "revenue",
+                "employee",
+                "supplier",
+                "inventory",
+                "transaction",
+            ),
+        )
+    )
+)
+
+# TIER 2: Simple task indicators (substrings, same as tier 1)
+_SIMPLE_INDICATORS_RE = re.compile(
+    "|".join(
+        map(
+            re.escape,
+            (
+                "what is",
+                "calculate",
+                "compute",
+                "convert",
+                "how much",
+                "percentage",
+                "sum",
+                "multiply",
+                "divide",
+            ),
+        )
+    )
+)
+
+def classify_task(task: str) -> str:
+    """
+    Two-tier classification for better routing
+
+    Tier 0: Constant-time fast paths (greetings, raw SQL)
+    Tier 1: Check for STRONG database indicators
+    Tier 2: Check for simple task indicators
+    """
+
+    task_lower = task.strip().lower()
+
+    # TIER 0: Trivially routable inputs
+    if task_lower in _TRIVIAL_GENERAL:
+        logger.info("🎯 Classified as GENERAL (trivial input)")
+        return "GENERAL_ASSISTANT_TEAM"
+
+    if _RAW_SQL_RE.match(task_lower):
+        logger.info("🎯 Classified as DATA (raw SQL)")
+        return "DATA_ANALYSIS_TEAM"
+
+    # TIER 1: Strong database/data indicators (prioritize these)
+    found = _DATA_INDICATORS_RE.findall(task_lower)
+
+    if found:
+        logger.info(f"🎯 Classified as DATA (found: {sorted(set(found))})")
+        return "DATA_ANALYSIS_TEAM"
+
+    # TIER 2: Simple task indicators (only if no complex indicators found)
+    if _SIMPLE_INDICATORS_RE.search(task_lower):
+        # Double-check it's not actually a database query (the other
+        # entities are tier 1 indicators, so only "from" can remain)
+        if "from" not in task_lower:
+            logger.info(f"🎯 Classified as GENERAL (simple task)")
+            return "GENERAL_ASSISTANT_TEAM"
+
+    # Default to general for ambiguous cases
+    logger.info(f"🎯 Classified as GENERAL (default)")
+    return "GENERAL_ASSISTANT_TEAM"
+
+
+# ============================================================
+# FOLLOW-UP DETECTION
+# ============================================================
+
+# Any of these means the message leans on earlier conversation
+_FOLLOW_UP_RE = re.compile(
+    r"|".join(
+        [
+            # References to previous content
+            r"\bit\b",
+            r"\bthat\b",
+            r"\bthis\b",
+            r"\bthese\b",
+            r"\bthose\b",
+            r"\bthem\b",
+            r"\btheir\b",
+            # Temporal references assuming context
+            r"\blast\b",
+            r"\bprevious\b",
+            r"\bbefore\b",
+            r"\bearlier\b",
+            r"\babove\b",
+            r"\bmentioned\b",
+            # Comparative references
+            r"\bcompare\b",
+            r"\bvs\b",
+            r"\bversus\b",
+            r"\bagainst\b",
+            # Clarification requests
+            r"\bwhat about\b",
+            r"\bhow about\b",
+            r"\bwhat if\b",
+            r"\bmore\b.*\bdetails\b",
+            r"\bshow.*\bmore\b",
+            # Continuation words
+            r"\balso\b",
+            r"\btoo\b",
+            r"\badditionally\b",
+            r"\bfurthermore\b",
+            # Direct references
+            r"\bsame\b",
+            r"\bagain\b",
+            r"\banother\b",
+        ]
+    ),
+    re.IGNORECASE,
+)
+
+# Words 4+ chars, used for topic overlap
+_TOPIC_WORD_RE = re.compile(r"\b\w{4,}\b")
+
+_TOPIC_STOPWORDS = frozenset(
+    {
+        "what",
+        "when",
+        "where",
+        "which",
+        "show",
+        "tell",
+        "give",
+        "find",
+        "list",
+    }
+)
+
+
+# Ambiguous references paired with the clarification to ask, in priority order
+_AMBIGUOUS_REFERENCES = (
+    (re.compile(r"\bit\b", re.IGNORECASE), "What are you referring to?"),
+    (
+        re.compile(r"\bthat\b", re.IGNORECASE),
+        "Which specific item are you asking about?",
+    ),
+    (
+        re.compile(r"\bthis\b", re.IGNORECASE),
+        "Can you clarify what you mean by 'this'?",
+    ),
+    (
+        re.compile(r"\bcompare\b.*\bto\b", re.IGNORECASE),
+        "What would you like me to compare?",
+    ),
+    (
+        re.compile(r"\bwhat about\b", re.IGNORECASE),
+        "What aspect would you like to know about?",
+    ),
+)
+
+# Words 5+ chars, used for the clarification topic check
+_CLARIFY_WORD_RE = re.compile(r"\b\w{5,}\b")
+
+
+# ============================================================
+# TOOL WRAPPERS - Shared by every Data Analysis Team build
+# ============================================================
+
+
+async def sql_tool_wrapper(query_description: str, sql_script: str) -> dict:
+    logger.info(f"🔧 SQL Tool: {query_description}")
+    return await generate_and_execute_sql(query_description, sql_script)
+
+
+async def data_analysis_tool_wrapper(data_json: str, analysis_type: str) -> dict:
+    logger.info(f"📊 Analysis Tool: {analysis_type}")
+    return await analyze_data_pandas(data_json, analysis_type)
+
+
+async def get_table_schema_wrapper(table_name: str) -> dict:
+    logger.info(f"📋 Schema Tool: {table_name}")
+    # pyodbc blocks - run it off the event loop so other streams keep flowing
+    async with _SCHEMA_SLOTS:
+        return await asyncio.to_thread(db.get_table_columns, table_name)
+
+
+async def get_table_schemas_wrapper(table_names: List[str]) -> dict:
+    logger.info(f"📋 Schema Tool (batch): {table_names}")
+
+    async def fetch_schema(table_name: str):
+        async with _SCHEMA_SLOTS:
+            return table_name, await asyncio.to_thread(db.get_table_columns, table_name)
+
+    return dict(await asyncio.gather(*(fetch_schema(t) for t in table_names)))
+
+
+async def list_all_tables_wrapper() -> dict:
+    logger.info("📚 List Tables Tool")
+    result = db.execute_query(
+        """
+        SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE
+        FROM INFORMATION_SCHEMA.TABLES
+        WHERE TABLE_TYPE = 'BASE TABLE'
+        ORDER BY TABLE_SCHEMA, TABLE_NAME
+    """
+    )
+    return result
+
 
 class EnhancedAgentOrchestrator:
     """
@@ -36,6 +528,7 @@ class EnhancedAgentOrchestrator:
         # Use model manager for automatic fallback
         self.model_manager = model_manager
         self.model_client = self.model_manager.get_model_client()
+        self._model_name = self.model_manager.current_model
 
         logger.info(f"✨ Enhanced Orchestrator initialized")
         logger.info(f"   Current model: {self.model_manager.current_model}")
@@ -135,11 +628,15 @@ class EnhancedAgentOrchestrator:
         - Multiple messages in lists
         """
 
-        # Convert to string if needed
-        if not isinstance(raw_content, str):
-            content_str = str(raw_content)
-        else:
+        if type(raw_content) is str:
+            # Common case from the stream loop - nothing to unwrap
             content_str = raw_content
+        else:
+            # Unwrap result/message/list shells iteratively down to a string
+            # leaf instead of stringifying the whole structure
+            content_str = _unwrap_content(raw_content)
+            if content_str is None or len(content_str.strip()) < 5:
+                content_str = str(raw_content)
 
         # Quick check: if no TextMessage wrapper, return as-is
         if "TextMessage(" not in content_str and "models_usage" not in content_str:
@@ -147,8 +644,7 @@ class EnhancedAgentOrchestrator:
 
         # Step 1: Extract all content='...' values
         # This handles nested quotes and escaped quotes
-        content_pattern = r"content=['\"]([^'\"]+(?:['\"]['\"][^'\"]+)*?)['\"]"
-        content_matches = re.findall(content_pattern, content_str)
+        content_matches = _CONTENT_FIELD_RE.findall(content_str)
 
         if content_matches:
             # Get the last meaningful content (usually the final answer)
@@ -160,23 +656,14 @@ class EnhancedAgentOrchestrator:
                     return cleaned.strip()
 
         # Step 2: If no content= found, try removing wrappers directly
-        # Remove TextMessage(...) wrappers completely
-        cleaned = re.sub(r"TextMessage\([^)]+\)", "", content_str)
-
-        # Remove list brackets
-        cleaned = re.sub(r"^\[|\]$", "", cleaned)
-
-        # Remove metadata fields
-        cleaned = re.sub(r"models_usage\s*=\s*\w+", "", cleaned)
-        cleaned = re.sub(r"metadata\s*=\s*\{[^}]*\}", "", cleaned)
-        cleaned = re.sub(r'source\s*=\s*["\'][^"\']+["\']', "", cleaned)
+        # Remove TextMessage(...) wrappers, list brackets and metadata fields
+        cleaned = _WRAPPER_NOISE_RE.sub("", content_str)
 
         # Remove extra commas and spaces
-        cleaned = re.sub(r"\s*,\s*", " ", cleaned)
-        cleaned = re.sub(r"\s+", " ", cleaned)
+        cleaned = _SEPARATOR_RE.sub(" ", cleaned)
 
         # Remove common prefixes that might remain
-        cleaned = re.sub(r"^messages\s*=\s*", "", cleaned)
+        cleaned = _MESSAGES_PREFIX_RE.sub("", cleaned)
 
         cleaned = cleaned.strip()
 
@@ -194,11 +681,10 @@ class EnhancedAgentOrchestrator:
         """
         if "[NEED_USER_INPUT:" in content:
             # Extract the question
-            import re
-            match = re.search(r'\[NEED_USER_INPUT:\s*(.+?)\]', content)
+            match = _NEED_USER_INPUT_RE.search(content)
             if match:
                 question = match.group(1).strip()
-                logger.info(f"💬 Agent needs user input: {question}")
+                logger.info("💬 Agent needs user input: {}", question)
                 return question
         return None
 
@@ -215,61 +701,54 @@ class EnhancedAgentOrchestrator:
         - Messages that are just TextMessage wrappers
         """
 
-        # Skip empty or very short
-        if not content or len(content.strip()) < 5:
-            logger.debug(f"⏭️ Skipping empty message from {source}")
+        # Skip empty or very short (length check first - O(1))
+        if not content or len(content) < 5 or len(content.strip()) < 5:
+            logger.debug("⏭️ Skipping empty message from {}", source)
             return False
 
-        content_lower = content.lower()
+        has_usage = _MODELS_USAGE_RE.search(content) is not None
 
         # Skip if it's still wrapped in TextMessage (filtering failed)
-        if "textmessage(" in content_lower and "content=" in content_lower:
-            logger.debug(f"⏭️ Skipping unfiltered TextMessage from {source}")
+        if _TEXTMESSAGE_CALL_RE.search(content) and _CONTENT_KW_RE.search(content):
+            logger.debug("⏭️ Skipping unfiltered TextMessage from {}", source)
             return False
 
         # Skip if it's just metadata
-        if all(keyword in content_lower for keyword in ["models_usage", "metadata"]):
-            logger.debug(f"⏭️ Skipping metadata from {source}")
+        if has_usage and _METADATA_KW_RE.search(content):
+            logger.debug("⏭️ Skipping metadata from {}", source)
             return False
 
         # Handle MagenticOneOrchestrator messages
         if source == "MagenticOneOrchestrator":
             # Only show if it contains final answer indicators
-            final_indicators = [
-                "final",
-                "answer",
-                "result",
-                "here is",
-                "here are",
-                "completed",
-                "summary",
-                "conclusion",
-            ]
-            if any(indicator in content_lower for indicator in final_indicators):
+            if _FINAL_INDICATOR_RE.search(content):
                 return True
             # Skip internal planning messages
-            planning_indicators = [
-                "we are working",
-                "to answer this",
-                "here is an initial",
-                "fact sheet",
-                "assembled the following",
-                "team:",
-            ]
-            if any(indicator in content_lower for indicator in planning_indicators):
-                logger.debug(f"⏭️ Skipping orchestrator planning from {source}")
+            if _PLANNING_INDICATOR_RE.search(content):
+                logger.debug("⏭️ Skipping orchestrator planning from {}", source)
                 return False
 
         # Skip very long messages that look like dumps
-        if len(content) > 3000 and (
-            "textmessage" in content_lower or "models_usage" in content_lower
-        ):
-            logger.debug(f"⏭️ Skipping long technical dump from {source}")
+        if len(content) > 3000 and (has_usage or _TEXTMESSAGE_RE.search(content)):
+            logger.debug("⏭️ Skipping long technical dump from {}", source)
             return False
 
         # Show everything else
         return True
 
+    def _final_text(self, team_result: Any) -> str:
+        """
+        Get the clean final answer from a team.run() result
+
+        Only the last message is cleaned - stringifying the whole TaskResult
+        drags the entire transcript through the regex cleanup.
+        """
+
+        messages = getattr(team_result, "messages", None)
+        if messages:
+            return self._extract_clean_content(getattr(messages[-1], "content", ""))
+        return self._extract_clean_content(team_result)
+
     # ============================================================
     # ADDITIONAL HELPER: Clean streaming messages in real-time
     # ============================================================
@@ -281,18 +760,20 @@ class EnhancedAgentOrchestrator:
         This is called BEFORE _extract_clean_content for extra safety
         """
 
-        # Get the content
-        if hasattr(raw_message, "content"):
+        # Get the content (plain strings are the common case - check first)
+        if type(raw_message) is str:
+            content = raw_message
+        elif hasattr(raw_message, "content"):
             content = raw_message.content
         else:
             content = str(raw_message)
 
         # Quick pre-cleaning
-        if isinstance(content, str):
+        if type(content) is str:
             # Remove obvious TextMessage patterns
             if content.startswith("TextMessage("):
                 # Extract just the content part
-                match = re.search(r"content=['\"]([^'\"]+)['\"]", content)
+                match = _STREAM_CONTENT_RE.search(content)
                 if match:
                     return match.group(1)
 
@@ -337,6 +818,44 @@ ALWAYS ask the user if unclear.
 
         return supervisor
 
+    # ============================================================
+    # TEAM CACHE
+    # ============================================================
+
+    async def _get_team(self, team_name: str) -> MagenticOneGroupChat:
+        """Check out a pooled team for team_name, building one if none is idle"""
+
+        now = time.monotonic()
+        _evict_idle_teams(now)
+
+        idle = _TEAM_POOL.get((team_name, self._model_name))
+        while idle:
+            _, team = idle.pop()
+            try:
+                # Clear conversation state left over from the previous task
+                await team.reset()
+                return team
+            except RuntimeError as e:
+                # Previous run was abandoned mid-flight - discard it
+                logger.warning("⚠️ Could not reset {}: {}", team_name, e)
+
+        if team_name == "DATA_ANALYSIS_TEAM":
+            return await self.create_data_analysis_team()
+        return await self.create_general_assistant_team()
+
+    def _release_team(self, team_name: str, team: MagenticOneGroupChat):
+        """Return a team that finished its task to the pool for reuse"""
+
+        idle = _TEAM_POOL.setdefault((team_name, self._model_name), [])
+        if len(idle) < settings.team_pool_max_idle:
+            idle.append((time.monotonic(), team))
+
+    def _switch_to_fallback_client(self):
+        """Swap in the fallback model client; pooled teams are keyed by model"""
+
+        self.model_client = self.model_manager.get_model_client()
+        self._model_name = self.model_manager.current_model
+
     # ============================================================
     # GENERAL ASSISTANT TEAM
     # ============================================================
@@ -383,38 +902,16 @@ ALWAYS ask the user if unclear.
     async def create_data_analysis_team(self) -> MagenticOneGroupChat:
         """Data Analysis Team with DATABASE-AWARE SQL agent"""
 
-        # Tool wrappers
-        async def sql_tool_wrapper(query_description: str, sql_script: str) -> dict:
-            logger.info(f"🔧 SQL Tool: {query_description}")
-            return await generate_and_execute_sql(query_description, sql_script)
-
-        async def data_analysis_tool_wrapper(
-            data_json: str, analysis_type: str
-        ) -> dict:
-            logger.info(f"📊 Analysis Tool: {analysis_type}")
-            return await analyze_data_pandas(data_json, analysis_type)
-
-        async def get_table_schema_wrapper(table_name: str) -> dict:
-            logger.info(f"📋 Schema Tool: {table_name}")
-            return db.get_table_schema(table_name)
-
-        async def list_all_tables_wrapper() -> dict:
-            logger.info("📚 List Tables Tool")
-            result = db.execute_query(
-                """
-                SELECT TABLE_SCHEMA, TABLE_NAME, TABLE_TYPE
-                FROM INFORMATION_SCHEMA.TABLES
-                WHERE TABLE_TYPE = 'BASE TABLE'
-                ORDER BY TABLE_SCHEMA, TABLE_NAME
-            """
-            )
-            return result
-
         # SQL Agent - DATABASE AWARE AND DIRECTIVE
         sql_agent = AssistantAgent(
             name="SQLAgent",
             model_client=self.model_client,
-            tools=[sql_tool_wrapper, get_table_schema_wrapper, list_all_tables_wrapper],
+            tools=[
+                sql_tool_wrapper,
+                get_table_schema_wrapper,
+                get_table_schemas_wrapper,
+                list_all_tables_wrapper,
+            ],
             system_message="""You are a SQL expert CONNECTED to MS SQL Server (AdventureWorksDW).
 
 🔴 CRITICAL: YOU ARE ALREADY CONNECTED - DON'T ASK FOR CREDENTIALS
@@ -422,12 +919,14 @@ ALWAYS ask the user if unclear.
 **Your Tools (USE THEM IMMEDIATELY):**
 1. list_all_tables_wrapper - See all tables NOW
 2. get_table_schema_wrapper(table) - See columns NOW
-3. sql_tool_wrapper(desc, sql) - Execute queries NOW
+3. get_table_schemas_wrapper([tables]) - See columns of SEVERAL tables in one call
+4. sql_tool_wrapper(desc, sql) - Execute queries NOW
 
 **WORKFLOW - NO QUESTIONS:**
 When user asks for data:
 1. ✅ Call list_all_tables_wrapper (see what exists)
 2. ✅ Call get_table_schema_wrapper on relevant table
+   (more than one table? use get_table_schemas_wrapper once instead)
 3. ✅ Generate SELECT query
 4. ✅ Execute with sql_tool_wrapper
 5. ✅ Return results
@@ -537,51 +1036,8 @@ Keep it short.""",
         if not previous_messages or len(previous_messages) == 0:
             return False
 
-        current_lower = current_message.lower()
-
         # STRONG indicators this is a follow-up (use context)
-        follow_up_indicators = [
-            # References to previous content
-            r"\bit\b",
-            r"\bthat\b",
-            r"\bthis\b",
-            r"\bthese\b",
-            r"\bthose\b",
-            r"\bthem\b",
-            r"\btheir\b",
-            # Temporal references assuming context
-            r"\blast\b",
-            r"\bprevious\b",
-            r"\bbefore\b",
-            r"\bearlier\b",
-            r"\babove\b",
-            r"\bmentioned\b",
-            # Comparative references
-            r"\bcompare\b",
-            r"\bvs\b",
-            r"\bversus\b",
-            r"\bagainst\b",
-            # Clarification requests
-            r"\bwhat about\b",
-            r"\bhow about\b",
-            r"\bwhat if\b",
-            r"\bmore\b.*\bdetails\b",
-            r"\bshow.*\bmore\b",
-            # Continuation words
-            r"\balso\b",
-            r"\btoo\b",
-            r"\badditionally\b",
-            r"\bfurthermore\b",
-            # Direct references
-            r"\bsame\b",
-            r"\bagain\b",
-            r"\banother\b",
-        ]
-
-        # Check if current message has follow-up indicators
-        has_followup = any(
-            re.search(pattern, current_lower) for pattern in follow_up_indicators
-        )
+        has_followup = _FOLLOW_UP_RE.search(current_message) is not None
 
         if not has_followup:
             logger.info("📋 No follow-up indicators - treating as NEW conversation")
@@ -599,23 +1055,12 @@ Keep it short.""",
             return False
 
         # Check topic similarity (keywords overlap)
-        current_words = set(re.findall(r"\b\w{4,}\b", current_lower))  # Words 4+ chars
-        previous_words = set(re.findall(r"\b\w{4,}\b", last_user_msg))
+        current_words = set(_TOPIC_WORD_RE.findall(current_message.lower()))
+        previous_words = set(_TOPIC_WORD_RE.findall(last_user_msg))
 
         # Remove common words
-        common_words = {
-            "what",
-            "when",
-            "where",
-            "which",
-            "show",
-            "tell",
-            "give",
-            "find",
-            "list",
-        }
-        current_words -= common_words
-        previous_words -= common_words
+        current_words -= _TOPIC_STOPWORDS
+        previous_words -= _TOPIC_STOPWORDS
 
         # Calculate overlap
         if current_words and previous_words:
@@ -705,35 +1150,29 @@ Keep it short.""",
         if not conversation_history or len(conversation_history) == 0:
             return None
 
-        current_lower = current_message.lower()
-
         # Check for ambiguous references
-        ambiguous_indicators = [
-            (r"\bit\b", "What are you referring to?"),
-            (r"\bthat\b", "Which specific item are you asking about?"),
-            (r"\bthis\b", "Can you clarify what you mean by 'this'?"),
-            (r"\bcompare\b.*\bto\b", "What would you like me to compare?"),
-            (r"\bwhat about\b", "What aspect would you like to know about?"),
-        ]
+        for pattern, question in _AMBIGUOUS_REFERENCES:
+            if pattern.search(current_message):
+                break
+        else:
+            return None
 
-        for pattern, question in ambiguous_indicators:
-            if re.search(pattern, current_lower):
-                # Check if topics are unrelated
-                last_user_msg = None
-                for msg in reversed(conversation_history):
-                    if msg.get("role") == "user":
-                        last_user_msg = msg.get("content", "").lower()
-                        break
+        # Check if topics are unrelated
+        last_user_msg = None
+        for msg in reversed(conversation_history):
+            if msg.get("role") == "user":
+                last_user_msg = msg.get("content", "").lower()
+                break
 
-                if last_user_msg:
-                    # Simple topic check
-                    current_words = set(re.findall(r"\b\w{5,}\b", current_lower))
-                    previous_words = set(re.findall(r"\b\w{5,}\b", last_user_msg))
+        if last_user_msg:
+            # Simple topic check
+            current_words = set(_CLARIFY_WORD_RE.findall(current_message.lower()))
+            previous_words = set(_CLARIFY_WORD_RE.findall(last_user_msg))
 
-                    overlap = len(current_words & previous_words)
+            overlap = len(current_words & previous_words)
 
-                    if overlap == 0:  # No overlap = totally different topics
-                        return f"I noticed you asked about something different earlier. {question}"
+            if overlap == 0:  # No overlap = totally different topics
+                return f"I noticed you asked about something different earlier. {question}"
 
         return None
         # def _build_context_prompt(self, current_message: str, conversation_history: List[Dict]) -> str:
@@ -791,82 +1230,8 @@ Keep it short.""",
     # ============================================================
 
     def _classify_task(self, task: str) -> str:
-        """
-        Two-tier classification for better routing
-
-        Tier 1: Check for STRONG database indicators
-        Tier 2: Check for simple task indicators
-        """
-
-        task_lower = task.lower()
-
-        # TIER 1: Strong database/data indicators (prioritize these)
-        complex_indicators = [
-            # Action verbs
-            "show",
-            "list",
-            "display",
-            "get",
-            "fetch",
-            "find",
-            "retrieve",
-            "analyze",
-            "compare",
-            "calculate from",
-            "query",
-            # Question starters
-            "how many",
-            "what are",
-            "which",
-            "who are",
-            # Database terms
-            "table",
-            "database",
-            "sql",
-            "data",
-            # Business entities
-            "sales",
-            "customer",
-            "product",
-            "order",
-            "revenue",
-            "employee",
-            "supplier",
-            "inventory",
-            "transaction",
-        ]
-
-        if any(indicator in task_lower for indicator in complex_indicators):
-            logger.info(
-                f"🎯 Classified as DATA (found: {[i for i in complex_indicators if i in task_lower]})"
-            )
-            return "DATA_ANALYSIS_TEAM"
-
-        # TIER 2: Simple task indicators (only if no complex indicators found)
-        simple_indicators = [
-            "what is",
-            "calculate",
-            "compute",
-            "convert",
-            "how much",
-            "percentage",
-            "sum",
-            "multiply",
-            "divide",
-        ]
-
-        if any(indicator in task_lower for indicator in simple_indicators):
-            # Double-check it's not actually a database query
-            if not any(
-                entity in task_lower
-                for entity in ["sales", "customer", "data", "table", "from"]
-            ):
-                logger.info(f"🎯 Classified as GENERAL (simple task)")
-                return "GENERAL_ASSISTANT_TEAM"
-
-        # Default to general for ambiguous cases
-        logger.info(f"🎯 Classified as GENERAL (default)")
-        return "GENERAL_ASSISTANT_TEAM"
+        """Route a task to a team (see module-level classify_task)"""
+        return classify_task(task)
 
     # ============================================================
     # MAIN EXECUTION
@@ -887,13 +1252,13 @@ Keep it short.""",
             conversation_history: Previous messages for context
         """
 
-        logger.info(f"{'='*60}")
-        logger.info(f"🚀 NEW TASK from {username}")
-        logger.info(f"📝 Task: {task_description}")
+        logger.info(_BANNER)
+        logger.info("🚀 NEW TASK from {}", username)
+        logger.info("📝 Task: {}", task_description)
 
         # Add context if available
         if conversation_history:
-            logger.info(f"📚 Received {len(conversation_history)} previous messages")
+            logger.info("📚 Received {} previous messages", len(conversation_history))
 
             # Check if we should ask for clarification FIRST
             clarification = self._should_ask_for_clarification(
@@ -901,7 +1266,7 @@ Keep it short.""",
             )
             if clarification:
                 logger.info(f"💬 Asking for clarification")
-                yield {
+                return {
                     "success": True,
                     "response": clarification,
                     "routed_to": "CLARIFICATION",
@@ -915,7 +1280,7 @@ Keep it short.""",
         else:
             enriched_task = task_description
 
-        logger.info(f"{'='*60}")
+        logger.info(_BANNER)
 
         try:
             # Classify using two-tier system
@@ -924,17 +1289,17 @@ Keep it short.""",
             # Create appropriate team
             if team_name == "DATA_ANALYSIS_TEAM":
                 logger.info(f"📊 Creating Data Analysis Team")
-                team = await self.create_data_analysis_team()
             else:
                 logger.info(f"💬 Creating General Assistant Team")
-                team = await self.create_general_assistant_team()
+            team = await self._get_team(team_name)
 
             # Execute with enriched task (includes context)
             # Execute with fallback support
-            logger.info(f"⚙️ Executing with {team_name}")
+            logger.info("⚙️ Executing with {}", team_name)
 
             try:
-                result = await team.run(task=enriched_task)
+                async with _AGENT_SLOTS:
+                    result = await team.run(task=enriched_task)
 
                 # Report success to model manager
                 self.model_manager.report_success()
@@ -945,17 +1310,15 @@ Keep it short.""",
                     logger.info("♻️ Retrying with fallback model...")
 
                     # Get new client with fallback model
-                    self.model_client = self.model_manager.get_model_client()
+                    self._switch_to_fallback_client()
 
                     # Recreate team with fallback model
-                    if team_name == "DATA_ANALYSIS_TEAM":
-                        team = await self.create_data_analysis_team()
-                    else:
-                        team = await self.create_general_assistant_team()
+                    team = await self._get_team(team_name)
 
                     # Retry once
                     try:
-                        result = await team.run(task=enriched_task)
+                        async with _AGENT_SLOTS:
+                            result = await team.run(task=enriched_task)
                         self.model_manager.report_success()
                         logger.info("✅ Fallback succeeded!")
                     except Exception as retry_error:
@@ -965,13 +1328,18 @@ Keep it short.""",
                     # Not a rate limit error, propagate
                     raise exec_error
 
-            # Extract clean response (continues as before)
-            response_text = self._extract_clean_content(result)
+            # Team finished cleanly - hand it back for the next task
+            self._release_team(team_name, team)
+
+            # Extract clean response from the final message only
+            response_text = self._final_text(result)
 
             logger.info(f"✅ Task completed successfully")
-            logger.info(f"📤 Response: {response_text[:200]}...")
+            logger.opt(lazy=True).info(
+                "📤 Response: {}...", lambda: response_text[:200]
+            )
 
-            yield {
+            return {
                 "success": True,
                 "response": response_text,
                 "routed_to": team_name,
@@ -980,10 +1348,9 @@ Keep it short.""",
             }
 
         except Exception as e:
-            logger.error(f"❌ Task execution failed: {e}")
-            logger.exception("Full traceback:")
+            logger.opt(exception=True).error("❌ Task execution failed: {}", e)
 
-            yield {
+            return {
                 "success": False,
                 "error": str(e),
                 "routed_to": team_name if "team_name" in locals() else "Unknown",
@@ -1010,7 +1377,7 @@ Keep it short.""",
         """
 
         try:
-            logger.info(f"{'='*60}")
+            logger.info(_BANNER)
             logger.info(f"🎬 STREAMING TASK from {username}")
             logger.info(f"📝 Task: {task_description}")
 
@@ -1034,7 +1401,7 @@ Keep it short.""",
             else:
                 enriched_task = task_description
 
-            logger.info(f"{'='*60}")
+            logger.info(_BANNER)
 
             # Classify and route
             team_name = self._classify_task(enriched_task)
@@ -1044,201 +1411,138 @@ Keep it short.""",
                 "agent": "SupervisorAgent",
                 "type": "routing",
                 "content": f"🎯 Routing to: **{team_name.replace('_', ' ').title()}**",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _event_timestamp(),
             }
 
             # Create team
-            if team_name == "DATA_ANALYSIS_TEAM":
-                team = await self.create_data_analysis_team()
-            else:
-                team = await self.create_general_assistant_team()
+            team = await self._get_team(team_name)
 
             # Stream execution with enriched task
-            if hasattr(team, "run_stream"):
-                try:
-                    async for message in team.run_stream(task=enriched_task):
-                        source = getattr(message, "source", "Unknown")
-                        raw_content = getattr(message, "content", "")
-
-                        # Pre-clean the message
-                        pre_cleaned = self._clean_streaming_message(raw_content)
-
-                        # Convert to string if needed
-                        if isinstance(pre_cleaned, (list, dict)):
-                            content = str(pre_cleaned)
-                        else:
-                            content = pre_cleaned
-
-                        # FILTER: Only show relevant messages
-                        if not self._should_show_message(source, content):
-                            logger.debug(f"⏭️ Skipping internal message from {source}")
-                            continue
-
-                        # CLEAN: Extract user-friendly content
-                        clean_content = self._extract_clean_content(content)
-
-                        # Check if agent needs user input
-                        user_input_needed = self._check_for_user_input_needed(clean_content)
-                        if user_input_needed:
-                            # Yield the question to user
-                            yield {
-                                "agent": source,
-                                "type": "question",  # NEW type
-                                "content": user_input_needed,
-                                "timestamp": datetime.now().isoformat(),
-                                "needs_user_input": True  # Flag for UI
-                            }
-                            # Stop streaming - wait for user response
-                            logger.info("⏸️ Pausing for user input")
-                            return
-
-                        # Classify message type
-                        message_type = self._classify_message_type(
-                            source, clean_content
-                        )
-
-                        # FINAL CHECK: Make sure we didn't leave any wrappers
-                        if "TextMessage(" in clean_content:
-                            logger.warning(
-                                f"⚠️ TextMessage wrapper still present, doing deep clean"
-                            )
-                            # Try one more aggressive clean
-                            clean_content = re.sub(
-                                r'.*content=["\']([^"\']+)["\'].*', r"\1", clean_content
-                            )
-
-                        # Classify message type
-                        message_type = self._classify_message_type(
-                            source, clean_content
-                        )
-
-                        # Yield to user
-                        yield {
-                            "agent": source,
-                            "type": message_type,
-                            "content": clean_content,
-                            "timestamp": datetime.now().isoformat(),
-                        }
-
-                        logger.debug(f"💬 [{source}] {clean_content[:100]}...")
-                    # Report success after streaming completes
-                    self.model_manager.report_success()
-
-                except Exception as stream_error:
-                    # Check if it's a rate limit error
-                    if self.model_manager.handle_model_error(stream_error):
-                        yield {
-                            "agent": "System",
-                            "type": "routing",
-                            "content": f"♻️ Rate limit hit, switching to fallback model ({self.model_manager.fallback_model})...",
-                            "timestamp": datetime.now().isoformat(),
-                        }
-
-                        # Get new client with fallback
-                        self.model_client = self.model_manager.get_model_client()
-
-                        # Recreate team
-                        if team_name == "DATA_ANALYSIS_TEAM":
-                            team = await self.create_data_analysis_team()
-                        else:
-                            team = await self.create_general_assistant_team()
-
-                        # Retry streaming with fallback
-                        async for message in team.run_stream(task=enriched_task):
-                            # ... same message processing ...
-                            source = getattr(message, "source", "Unknown")
-                            raw_content = getattr(message, "content", "")
-
-                            # Pre-clean the message
-                            pre_cleaned = self._clean_streaming_message(raw_content)
-
-                            # Convert to string if needed
-                            if isinstance(pre_cleaned, (list, dict)):
-                                content = str(pre_cleaned)
-                            else:
-                                content = pre_cleaned
-
-                            # FILTER: Only show relevant messages
-                            if not self._should_show_message(source, content):
-                                logger.debug(
-                                    f"⏭️ Skipping internal message from {source}"
-                                )
-                                continue
-
-                            # CLEAN: Extract user-friendly content
-                            clean_content = self._extract_clean_content(content)
-
-                            # Check if agent needs user input
-                            user_input_needed = self._check_for_user_input_needed(
-                                clean_content
-                            )
-                            if user_input_needed:
-                                # Yield the question to user
-                                yield {
-                                    "agent": source,
-                                    "type": "question",  # NEW type
-                                    "content": user_input_needed,
-                                    "timestamp": datetime.now().isoformat(),
-                                    "needs_user_input": True,  # Flag for UI
-                                }
-                                # Stop streaming - wait for user response
-                                logger.info("⏸️ Pausing for user input")
-                                return
-
-                            # FINAL CHECK: Make sure we didn't leave any wrappers
-                            if "TextMessage(" in clean_content:
-                                logger.warning(
-                                    f"⚠️ TextMessage wrapper still present, doing deep clean"
-                                )
-                                # Try one more aggressive clean
-                                clean_content = re.sub(
-                                    r'.*content=["\']([^"\']+)["\'].*',
-                                    r"\1",
-                                    clean_content,
-                                )
-
-                            # Classify message type
-                            message_type = self._classify_message_type(
-                                source, clean_content
-                            )
-
-                            # Yield to user
-                            yield {
-                                "agent": source,
-                                "type": message_type,
-                                "content": clean_content,
-                                "timestamp": datetime.now().isoformat(),
-                            }
+            try:
+                async for event in self._stream_team_events(
+                    team_name, team, enriched_task
+                ):
+                    yield event
 
-                        self.model_manager.report_success()
-                    else:
-                        # Not a rate limit error
-                        raise stream_error
+            except Exception as stream_error:
+                # Check if it's a rate limit error
+                if self.model_manager.handle_model_error(stream_error):
+                    yield {
+                        "agent": "System",
+                        "type": "routing",
+                        "content": f"♻️ Rate limit hit, switching to fallback model ({self.model_manager.fallback_model})...",
+                        "timestamp": _event_timestamp(),
+                    }
 
-            else:
-                # Fallback: execute and return result
-                result = await team.run(task=enriched_task)
-                response = self._extract_clean_content(result)
+                    # Get new client with fallback
+                    self._switch_to_fallback_client()
 
-                yield {
-                    "agent": team_name,
-                    "type": "final",
-                    "content": response,
-                    "timestamp": datetime.now().isoformat(),
-                }
+                    # Recreate team
+                    team = await self._get_team(team_name)
+
+                    # Retry streaming with fallback
+                    async for event in self._stream_team_events(
+                        team_name, team, enriched_task
+                    ):
+                        yield event
+                else:
+                    # Not a rate limit error
+                    raise stream_error
 
             logger.info(f"✅ Streaming completed for {username}")
 
         except Exception as e:
-            logger.error(f"❌ Streaming failed: {e}")
-            logger.exception("Full traceback:")
+            logger.opt(exception=True).error("❌ Streaming failed: {}", e)
             yield {
                 "agent": "System",
                 "type": "error",
                 "content": f"❌ Error: {str(e)}",
-                "timestamp": datetime.now().isoformat(),
+                "timestamp": _event_timestamp(),
             }
 
+    async def _stream_team_events(
+        self, team_name: str, team: MagenticOneGroupChat, task: str
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Run team.run_stream and yield cleaned, user-facing events
+
+        Stops early (without reporting success) when an agent asks the user
+        for input; otherwise reports success and returns the team to the
+        pool once the stream completes.
+        """
+
+        # Unbounded buffer: the run (and its agent slot) never waits on the client
+        async for message in _prefetch(
+            _limited(team.run_stream(task=task)), maxsize=0
+        ):
+            source = getattr(message, "source", "Unknown")
+            raw_content = getattr(message, "content", "")
+
+            # Cheap pre-filter: cleaning only shortens strings, so anything
+            # already too short for _should_show_message can be dropped here
+            if type(raw_content) is str and len(raw_content) < 5:
+                logger.debug("⏭️ Skipping empty message from {}", source)
+                continue
+
+            # Pre-clean the message
+            pre_cleaned = self._clean_streaming_message(raw_content)
+
+            # Convert to string if needed
+            if type(pre_cleaned) is str:
+                content = pre_cleaned
+            elif isinstance(pre_cleaned, (list, dict)):
+                content = str(pre_cleaned)
+            else:
+                content = pre_cleaned
+
+            # FILTER: Only show relevant messages
+            if not self._should_show_message(source, content):
+                logger.debug("⏭️ Skipping internal message from {}", source)
+                continue
+
+            # CLEAN: Extract user-friendly content
+            clean_content = self._extract_clean_content(content)
+
+            # Check if agent needs user input
+            user_input_needed = self._check_for_user_input_needed(clean_content)
+            if user_input_needed:
+                # Yield the question to user
+                yield {
+                    "agent": source,
+                    "type": "question",
+                    "content": user_input_needed,
+                    "timestamp": _event_timestamp(),
+                    "needs_user_input": True,  # Flag for UI
+                }
+                # Stop streaming - wait for user response
+                logger.info("⏸️ Pausing for user input")
+                return
+
+            # FINAL CHECK: Make sure we didn't leave any wrappers
+            if "TextMessage(" in clean_content:
+                logger.warning("⚠️ TextMessage wrapper still present, doing deep clean")
+                # Try one more aggressive clean
+                clean_content = _DEEP_CLEAN_RE.sub(r"\1", clean_content)
+
+            # Classify message type
+            message_type = self._classify_message_type(source, clean_content)
+
+            # Yield to user
+            yield {
+                "agent": source,
+                "type": message_type,
+                "content": clean_content,
+                "timestamp": _event_timestamp(),
+            }
+
+            logger.opt(lazy=True).debug(
+                "💬 [{}] {}...", lambda: source, lambda: clean_content[:100]
+            )
+
+        # Report success after streaming completes
+        self.model_manager.report_success()
+        self._release_team(team_name, team)
+
     # ============================================================
     # HELPER: Message Type Classification
     # ============================================================
@@ -1249,31 +1553,32 @@ Keep it short.""",
         if not isinstance(content, str):
             content = str(content)
 
-        content_lower = content.lower()
-        agent_lower = agent.lower()
+        found = {m.lastgroup for m in _MESSAGE_KEYWORDS_RE.finditer(content)}
 
         # SQL queries
-        if "select" in content_lower and "from" in content_lower:
+        if "select" in found and "from" in found:
             return "action"
 
         # Tool calls
-        if "calling" in content_lower or "executing" in content_lower:
+        if "tool" in found:
             return "action"
 
+        agent_kind = _agent_kind(agent)
+
         # Validation
-        if "validation" in agent_lower or "approved" in content_lower:
+        if agent_kind == "validation" or "validation" in found:
             return "validation"
 
         # Analysis
-        if "analysis" in agent_lower or "statistic" in content_lower:
+        if agent_kind == "analysis" or "analysis" in found:
             return "analysis"
 
         # Thinking
-        if any(word in content_lower for word in ["i will", "let me", "first"]):
+        if "thinking" in found:
             return "thinking"
 
         # Errors
-        if "error" in content_lower or "failed" in content_lower:
+        if "error" in found:
             return "error"
 
         # Default
@@ -1,7 +1,10 @@
 import asyncio
-from typing import Optional
+import traceback
+from typing import Any, AsyncIterator, Dict, List, Optional
 from loguru import logger
 from autogen_agentchat.agents import AssistantAgent
+from autogen_agentchat.base import TaskResult
+from autogen_agentchat.conditions import TextMentionTermination
 from autogen_agentchat.teams import MagenticOneGroupChat
 from autogen_ext.models.ollama import OllamaChatCompletionClient
 from config.settings import settings
@@ -9,6 +12,71 @@ from mcp_server.tools import generate_and_execute_sql, analyze_data_pandas
 from mcp_server.database import db
 
 
+# ValidationAgent's sign-off marker - a token no rejection ("NOT APPROVED") can contain
+_APPROVAL_SENTINEL = "<<VALIDATION_APPROVED>>"
+
+# Agent system prompts - built once at import and shared by every team
+_SQL_SYSTEM_MSG = """You are an expert SQL developer for Microsoft SQL Server.
+
+Your responsibilities:
+1. Understand natural language requests for data
+2. Generate accurate, optimized SQL queries
+3. Use the sql_tool_wrapper to execute queries against the data warehouse
+4. Handle errors gracefully and provide clear feedback
+5. Never execute DROP, DELETE, TRUNCATE, or ALTER commands
+6. Always retrieve table schemas before writing queries using get_table_schema_wrapper
+7. Explain your SQL logic to the team
+
+When retrieving data:
+- Use SELECT TOP for initial data exploration
+- Request table schema via get_table_schema_wrapper tool if needed
+- Report row counts and data types
+- Pass results to AnalysisAgent for further processing"""
+
+_ANALYSIS_SYSTEM_MSG = """You are a data analyst and data scientist.
+
+Your responsibilities:
+1. Receive data retrieved by SQLAgent
+2. Perform statistical analysis using the data_analysis_tool_wrapper
+3. Identify trends, patterns, and anomalies
+4. Calculate key metrics and aggregations
+5. Create meaningful insights from raw data
+6. Provide clear, actionable recommendations
+7. Highlight any data quality issues
+
+Analysis types you can perform:
+- Summary: Basic statistics, null values, duplicates
+- Correlation: Correlation matrices for numeric data
+- Trend: Time-series analysis if dates are present
+
+Always validate your findings and explain methodology to ValidationAgent."""
+
+_VALIDATION_SYSTEM_MSG = """You are a quality assurance specialist and data validator.
+
+Your responsibilities:
+1. Review SQL queries for accuracy and safety
+2. Validate data analysis results
+3. Check for logical inconsistencies
+4. Verify data meets business requirements
+5. Ensure all steps were executed correctly
+6. Approve or request corrections
+
+Validation checklist:
+□ SQL query syntax is correct for MS SQL Server
+□ No dangerous operations (DROP, DELETE, etc)
+□ Data retrieved matches the request
+□ Analysis methodology is sound
+□ Results are logically consistent
+□ Findings support the conclusions
+□ All assumptions are documented
+
+Approval process:
+- If everything checks out: Summarize findings and end your reply with <<VALIDATION_APPROVED>>
+- Never write <<VALIDATION_APPROVED>> when requesting corrections
+- If issues found: Request specific corrections
+- Escalate complex issues to human team lead"""
+
+
 class AgentOrchestrator:
     """
     Orchestrates AutoGen 2 agents with Ollama LLM
@@ -23,10 +91,14 @@ class AgentOrchestrator:
             base_url=settings.ollama_host,
             temperature=0.7,
             max_tokens=2000,
+            keep_alive=settings.ollama_keep_alive,
             model_info=settings.ollama_model_info,
         )
         logger.info(f"Initialized Ollama client with model: {settings.ollama_model}")
 
+        # Teams that finished a task, reset and reused by the next one
+        self._idle_teams: List[MagenticOneGroupChat] = []
+
     async def setup_agents(self) -> MagenticOneGroupChat:
         """
         Create and configure the agent team with direct tool integration
@@ -48,30 +120,15 @@ class AgentOrchestrator:
 
         async def get_table_schema_wrapper(table_name: str) -> dict:
             """Get schema information for a specific table"""
-            logger.info(f"Schema tool called for table: {table_name}")
-            return db.get_table_schema(table_name)
+            logger.info("Schema tool called for table: {}", table_name)
+            return db.get_table_columns(table_name)
 
         # SQL Generation & Execution Agent
         sql_agent = AssistantAgent(
             name="SQLAgent",
             model_client=self.model_client,
             tools=[sql_tool_wrapper, get_table_schema_wrapper],
-            system_message="""You are an expert SQL developer for Microsoft SQL Server.
-
-Your responsibilities:
-1. Understand natural language requests for data
-2. Generate accurate, optimized SQL queries
-3. Use the sql_tool_wrapper to execute queries against the data warehouse
-4. Handle errors gracefully and provide clear feedback
-5. Never execute DROP, DELETE, TRUNCATE, or ALTER commands
-6. Always retrieve table schemas before writing queries using get_table_schema_wrapper
-7. Explain your SQL logic to the team
-
-When retrieving data:
-- Use SELECT TOP for initial data exploration
-- Request table schema via get_table_schema_wrapper tool if needed
-- Report row counts and data types
-- Pass results to AnalysisAgent for further processing""",
+            system_message=_SQL_SYSTEM_MSG,
         )
 
         # Data Analysis Agent
@@ -79,52 +136,14 @@ When retrieving data:
             name="AnalysisAgent",
             model_client=self.model_client,
             tools=[data_analysis_tool_wrapper],
-            system_message="""You are a data analyst and data scientist.
-
-Your responsibilities:
-1. Receive data retrieved by SQLAgent
-2. Perform statistical analysis using the data_analysis_tool_wrapper
-3. Identify trends, patterns, and anomalies
-4. Calculate key metrics and aggregations
-5. Create meaningful insights from raw data
-6. Provide clear, actionable recommendations
-7. Highlight any data quality issues
-
-Analysis types you can perform:
-- Summary: Basic statistics, null values, duplicates
-- Correlation: Correlation matrices for numeric data
-- Trend: Time-series analysis if dates are present
-
-Always validate your findings and explain methodology to ValidationAgent.""",
+            system_message=_ANALYSIS_SYSTEM_MSG,
         )
 
         # Validation & Quality Assurance Agent
         validation_agent = AssistantAgent(
             name="ValidationAgent",
             model_client=self.model_client,
-            system_message="""You are a quality assurance specialist and data validator.
-
-Your responsibilities:
-1. Review SQL queries for accuracy and safety
-2. Validate data analysis results
-3. Check for logical inconsistencies
-4. Verify data meets business requirements
-5. Ensure all steps were executed correctly
-6. Approve or request corrections
-
-Validation checklist:
-□ SQL query syntax is correct for MS SQL Server
-□ No dangerous operations (DROP, DELETE, etc)
-□ Data retrieved matches the request
-□ Analysis methodology is sound
-□ Results are logically consistent
-□ Findings support the conclusions
-□ All assumptions are documented
-
-Approval process:
-- If everything checks out: Approve and summarize findings
-- If issues found: Request specific corrections
-- Escalate complex issues to human team lead""",
+            system_message=_VALIDATION_SYSTEM_MSG,
         )
 
         # Create Magentic Team for group chat
@@ -132,11 +151,39 @@ Approval process:
             participants=[sql_agent, analysis_agent, validation_agent],
             model_client=self.model_client,
             max_turns=15,  # Limit conversation turns to prevent infinite loops
+            # Stop as soon as ValidationAgent signs off instead of running out the turns
+            termination_condition=TextMentionTermination(
+                _APPROVAL_SENTINEL, sources=["ValidationAgent"]
+            ),
         )
 
         logger.info("Agent team successfully configured")
         return team
 
+    async def _acquire_team(self) -> MagenticOneGroupChat:
+        """
+        Reuse an idle team if one is available, otherwise build a new one
+
+        Each caller gets its own team, so concurrent tasks never share one.
+        """
+
+        while self._idle_teams:
+            team = self._idle_teams.pop()
+            try:
+                await team.reset()
+                return team
+            except RuntimeError as e:
+                # Previous run was abandoned mid-flight - discard it
+                logger.warning(f"Discarding team that could not be reset: {e}")
+
+        return await self.setup_agents()
+
+    async def aclose(self):
+        """Drop idle teams and close the model client (call once on shutdown)"""
+        self._idle_teams.clear()
+        await self.model_client.close()
+        logger.info("Agent orchestrator closed")
+
     async def execute_task(
         self, task_description: str, username: str = "system"
     ) -> dict:
@@ -152,16 +199,19 @@ Approval process:
         """
 
         try:
-            logger.info(f"Starting task execution for user: {username}")
-            logger.info(f"Task: {task_description}")
+            logger.info("Starting task execution for user: {}", username)
+            logger.info("Task: {}", task_description)
 
-            # Setup agents
-            team = await self.setup_agents()
+            # Setup agents (reused across tasks)
+            team = await self._acquire_team()
 
             # Execute the team
             result = await team.run(task=task_description)
 
-            logger.info(f"Task completed successfully for user: {username}")
+            # Finished cleanly - keep the team for the next task
+            self._idle_teams.append(team)
+
+            logger.info("Task completed successfully for user: {}", username)
 
             return {
                 "success": True,
@@ -182,11 +232,9 @@ Approval process:
             }
 
         except Exception as e:
-            import traceback
-
-            error_details = traceback.format_exc()
-            logger.error(f"Task execution failed: {e}")
-            logger.error(f"Full traceback:\n{error_details}")
+            # Full traceback goes to the log; the response only carries the summary
+            error_details = "".join(traceback.format_exception_only(type(e), e))
+            logger.opt(exception=True).error("Task execution failed: {}", e)
             return {
                 "success": False,
                 "user": username,
@@ -195,3 +243,50 @@ Approval process:
                 "error_details": error_details,
                 "status": "failed",
             }
+
+    async def execute_task_stream(
+        self, task_description: str, username: str = "system"
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Execute a data analysis task, yielding agent messages as they arrive
+
+        Args:
+            task_description: Natural language description of the task
+            username: User requesting the analysis (for audit logging)
+
+        Yields:
+            One dict per agent message, then a final "completed" or "error" dict
+        """
+
+        logger.info("Starting streamed task for user: {}", username)
+        logger.info("Task: {}", task_description)
+
+        try:
+            team = await self._acquire_team()
+
+            async for message in team.run_stream(task=task_description):
+                if isinstance(message, TaskResult):
+                    # Finished cleanly - keep the team for the next task. On error
+                    # or client disconnect the run may still be winding down, so
+                    # the team is dropped and the next task builds a fresh one.
+                    self._idle_teams.append(team)
+                    logger.info("Streamed task completed for user: {}", username)
+                    yield {
+                        "type": "completed",
+                        "stop_reason": message.stop_reason,
+                    }
+                    return
+
+                yield {
+                    "type": type(message).__name__,
+                    "agent": getattr(message, "source", None),
+                    "content": str(getattr(message, "content", "")),
+                }
+
+        except Exception as e:
+            logger.opt(exception=True).error("Streamed task failed: {}", e)
+            yield {
+                "type": "error",
+                "error": str(e),
+                "error_details": "".join(traceback.format_exception_only(type(e), e)),
+            }
@@ -1,4 +1,5 @@
 from ldap3 import Server, Connection, ALL
+from ldap3.utils.conv import escape_filter_chars
 from config.settings import settings
 from loguru import logger
 from typing import Tuple, Optional, List
@@ -14,6 +15,8 @@ class LDAPManager:
             use_ssl=settings.ldap_use_ssl,
             get_info=ALL,
         )
+        self.user_dn_pattern = settings.ldap_user_dn_pattern
+        self.base_dn = settings.ldap_base_dn
 
     def authenticate_user(
         self, username: str, password: str
@@ -23,32 +26,35 @@ class LDAPManager:
         Returns: (success: bool, user_info: dict or None)
         """
         try:
-            user_dn = settings.ldap_user_dn_pattern.format(
-                username=username, base_dn=settings.ldap_base_dn
+            user_dn = self.user_dn_pattern.format(
+                username=username, base_dn=self.base_dn
             )
 
+            # The bind must use the user's own credentials - that is the check
             conn = Connection(
                 self.server, user=user_dn, password=password, auto_bind=True
             )
 
-            logger.info(f"User {username} authenticated successfully")
+            logger.info("User {} authenticated successfully", username)
 
-            # Retrieve user groups/attributes
-            user_info = self._get_user_info(conn, username)
-            conn.unbind()
+            # Retrieve user groups/attributes over the same bound connection
+            try:
+                user_info = self._get_user_info(conn, username)
+            finally:
+                conn.unbind()
 
             return True, user_info
 
         except Exception as e:
-            logger.warning(f"Authentication failed for user {username}: {str(e)}")
+            logger.warning("Authentication failed for user {}: {}", username, e)
             return False, None
 
     def _get_user_info(self, conn: Connection, username: str) -> dict:
         """Get user information including groups"""
         try:
-            search_filter = f"(sAMAccountName={username})"
+            search_filter = f"(sAMAccountName={escape_filter_chars(username)})"
             conn.search(
-                search_base=settings.ldap_base_dn,
+                search_base=self.base_dn,
                 search_filter=search_filter,
                 attributes=["mail", "displayName", "memberOf"],
             )
@@ -62,7 +68,10 @@ class LDAPManager:
                         str(entry.displayName.value) if entry.displayName else username
                     ),
                     "groups": (
-                        [str(g) for g in entry.memberOf.values]
+                        [
+                            g.decode("utf-8", "ignore")
+                            for g in entry.memberOf.raw_values
+                        ]
                         if entry.memberOf
                         else []
                     ),
@@ -1,3 +1,4 @@
+from functools import lru_cache
 from pydantic_settings import BaseSettings
 from typing import Optional
 
@@ -31,6 +32,7 @@ class Settings(BaseSettings):
     # Token and Context Configuration
     max_tokens: int = 8000  # INCREASED from 4000
     temperature: float = 0.3
+    ollama_keep_alive: str = "30m"  # Keep model + prompt KV cache resident between calls
 
     # Rate Limiting
     max_retries_per_query: int = 3
@@ -76,6 +78,9 @@ class Settings(BaseSettings):
     # Agents
     agent_retry_attempts: int = 3
     agent_escalation_email: str
+    team_pool_idle_ttl_seconds: int = 900  # Drop pooled teams idle this long
+    team_pool_max_idle: int = 4  # Idle teams kept per (team, model)
+    max_concurrent_agents: int = 4  # Team runs allowed at once per process
     log_level: str = "INFO"
 
     # Security
@@ -88,6 +93,13 @@ class Settings(BaseSettings):
     class Config:
         env_file = r"G:\dataden.ai\autogen-mcp-system\config\.env"
         case_sensitive = False
+        frozen = True
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Return the process-wide settings, validated once"""
+    return Settings()
+
+
+settings = get_settings()
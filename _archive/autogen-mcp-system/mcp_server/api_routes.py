@@ -2,7 +2,6 @@
 # COMPLETE API Routes - Matches Working Orchestrator
 # ============================================================
 
-import asyncio
 import json
 from datetime import datetime
 from typing import Any, Dict, List, Optional
@@ -146,6 +145,23 @@ async def stream_response(
         if conversation_history:
             logger.info(f"📚 Context: {len(conversation_history)} previous messages")
 
+        # OpenAI chunk envelope, built once and refilled per event.
+        # Safe to reuse: each chunk is serialized before the next one is built.
+        delta = {"role": "assistant", "content": ""}
+        chunk = {
+            "id": conversation_id,
+            "object": "chat.completion.chunk",
+            "created": 0,
+            "model": "autogen-agents",
+            "choices": [
+                {
+                    "index": 0,
+                    "delta": delta,
+                    "finish_reason": None,
+                }
+            ],
+        }
+
         # Pass conversation history to orchestrator
         async for event in orchestrator.execute_with_streaming(
             task_description=message,
@@ -153,25 +169,10 @@ async def stream_response(
             conversation_history=conversation_history,  # NEW: Pass context
         ):
             # Format as OpenAI chunk
-            chunk = {
-                "id": conversation_id,
-                "object": "chat.completion.chunk",
-                "created": int(datetime.now().timestamp()),
-                "model": "autogen-agents",
-                "choices": [
-                    {
-                        "index": 0,
-                        "delta": {
-                            "role": "assistant",
-                            "content": format_message(event),
-                        },
-                        "finish_reason": None,
-                    }
-                ],
-            }
+            chunk["created"] = int(datetime.now().timestamp())
+            delta["content"] = format_message(event)
 
             yield f"data: {json.dumps(chunk)}\n\n"
-            await asyncio.sleep(0.01)
 
         # Final chunk
         final_chunk = {
@@ -1,14 +1,29 @@
+import re
+import time
+
 import pyodbc
 from config.settings import settings
 from loguru import logger
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Tuple
 from tenacity import retry, stop_after_attempt, wait_exponential
 
+# Statements the agents may never run - one pass over the query, whole words only
+# so column names like CreatedDate or AlternateKey don't trip it
+_DANGEROUS_SQL_RE = re.compile(
+    r"\b(DROP|DELETE|TRUNCATE|ALTER|CREATE|EXEC(?:UTE)?|SP_CONFIGURE|XP_\w+)\b",
+    re.IGNORECASE,
+)
+
 
 class DataWarehouseConnection:
     """Manages MS SQL Server connections and query execution"""
 
+    # Schemas rarely change - serve repeat lookups from memory for this long
+    SCHEMA_CACHE_TTL_SECONDS = 600
+
     def __init__(self):
+        # table_name -> (fetched_at, schema result)
+        self._schema_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
         self.conn_str = (
             f"Driver={settings.mssql_driver};"
             f"Server={settings.mssql_server};"
@@ -34,13 +49,11 @@ class DataWarehouseConnection:
         Validate SQL query for dangerous operations
         Returns: (is_safe: bool, error_message: str or None)
         """
-        dangerous_keywords = ["DROP", "DELETE", "TRUNCATE", "ALTER", "CREATE"]
-
-        for keyword in dangerous_keywords:
-            if keyword in sql_query.upper():
-                error = f"Query contains dangerous operation: {keyword}"
-                logger.warning(error)
-                return False, error
+        match = _DANGEROUS_SQL_RE.search(sql_query)
+        if match:
+            error = f"Query contains dangerous operation: {match.group(1).upper()}"
+            logger.warning(error)
+            return False, error
 
         return True, None
 
@@ -100,14 +113,38 @@ class DataWarehouseConnection:
             return {"success": False, "error": str(e), "error_type": "unknown"}
 
     def get_table_schema(self, table_name: str) -> Dict[str, Any]:
-        """Retrieve table schema for reference"""
+        """Retrieve table schema for reference (cached for a few minutes)"""
+        cached = self._schema_cache.get(table_name)
+        if cached and time.monotonic() - cached[0] < self.SCHEMA_CACHE_TTL_SECONDS:
+            return cached[1]
+
         query = f"""
         SELECT COLUMN_NAME, DATA_TYPE, IS_NULLABLE 
         FROM INFORMATION_SCHEMA.COLUMNS 
         WHERE TABLE_NAME = '{table_name}'
         ORDER BY ORDINAL_POSITION
         """
-        return self.execute_query(query)
+        result = self.execute_query(query)
+
+        # Only cache good lookups so transient failures are retried
+        if result.get("success"):
+            self._schema_cache[table_name] = (time.monotonic(), result)
+        return result
+
+    def get_table_columns(self, table_name: str) -> Dict[str, Any]:
+        """Table schema as parallel name/type/nullable lists (compact for agents)"""
+        result = self.get_table_schema(table_name)
+        if not result.get("success"):
+            return result
+
+        rows = result["rows"]
+        return {
+            "success": True,
+            "table": table_name,
+            "names": [row["COLUMN_NAME"] for row in rows],
+            "types": [row["DATA_TYPE"] for row in rows],
+            "nullable": [row["IS_NULLABLE"] == "YES" for row in rows],
+        }
 
 
 db = DataWarehouseConnection()
@@ -1,20 +1,38 @@
+import asyncio
+import json
+from contextlib import asynccontextmanager
+
 import uvicorn
 from config.settings import settings
 from fastapi import Depends, FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import StreamingResponse
 from loguru import logger
 from mcp_server.api_routes import router as openwebui_router
 from mcp_server.auth import verify_credentials
 from mcp_server.database import db
 from mcp_server.tools import analyze_data_pandas, generate_and_execute_sql
 from utils.logging_config import setup_logging
+from utils.model_manager import model_manager
 
 # Setup logging
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up the fallback model in the background so startup isn't delayed"""
+    warmup = asyncio.create_task(model_manager.warm_up_fallback())
+    yield
+    warmup.cancel()
+
+
 # Create FastAPI app
 app = FastAPI(
-    title="MCP Agent System", description="MS SQL Server + Ollama + AutoGen 2", version="1.0.0"
+    title="MCP Agent System",
+    description="MS SQL Server + Ollama + AutoGen 2",
+    version="1.0.0",
+    lifespan=lifespan,
 )
 
 
@@ -121,10 +139,6 @@ async def verify_user(user_info: dict = Depends(verify_credentials)):
 @app.get("/mcp/sse")
 async def mcp_sse():
     """MCP Server-Sent Events endpoint"""
-    import asyncio
-    import json
-
-    from fastapi.responses import StreamingResponse
 
     async def event_stream():
         # Send initial connection message
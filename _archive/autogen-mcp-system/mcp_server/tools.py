@@ -1,3 +1,7 @@
+import asyncio
+import json
+
+import pandas as pd
 from mcp_server.database import db
 from utils.retry_handler import retry_handler
 from typing import Dict, Any
@@ -19,8 +23,11 @@ async def generate_and_execute_sql(
     """
     logger.info(f"SQL Tool called: {query_description}")
 
-    # Use retry handler for fault tolerance
-    result = retry_handler.execute_with_retry(db.execute_query, sql_script)
+    # Use retry handler for fault tolerance (off the event loop - it blocks on
+    # pyodbc and sleeps between attempts)
+    result = await asyncio.to_thread(
+        retry_handler.execute_with_retry, db.execute_query, sql_script
+    )
 
     return result
 
@@ -36,9 +43,6 @@ async def analyze_data_pandas(data_json: str, analysis_type: str) -> Dict[str, A
     Returns:
         Analysis results
     """
-    import pandas as pd
-    import json
-
     try:
         logger.info(f"Analysis tool called: {analysis_type}")
 
@@ -28,25 +28,29 @@ async def main():
 
     orchestrator = AgentOrchestrator()
 
-    for i, task in enumerate(example_tasks, 1):
-        logger.info(f"\n{'='*60}")
-        logger.info(f"TASK {i}/{len(example_tasks)}")
-        logger.info(f"{'='*60}")
-
-        result = await orchestrator.execute_task(
-            task_description=task, username="test_user"
-        )
-
-        # Pretty print results
-        if result["success"]:
-            logger.info(f"✓ Task completed successfully")
-            print("\nAgent Conversation:")
-            print(result["result"])
-        else:
-            logger.error(f"✗ Task failed: {result['error']}")
-
-        # Small delay between tasks
-        await asyncio.sleep(2)
+    # One orchestrator (and its reused team) serves every task
+    try:
+        for i, task in enumerate(example_tasks, 1):
+            logger.info(f"\n{'='*60}")
+            logger.info(f"TASK {i}/{len(example_tasks)}")
+            logger.info(f"{'='*60}")
+
+            result = await orchestrator.execute_task(
+                task_description=task, username="test_user"
+            )
+
+            # Pretty print results
+            if result["success"]:
+                logger.info(f"✓ Task completed successfully")
+                print("\nAgent Conversation:")
+                print(result["result"])
+            else:
+                logger.error(f"✗ Task failed: {result['error']}")
+
+            # Small delay between tasks
+            await asyncio.sleep(2)
+    finally:
+        await orchestrator.aclose()
 
     logger.info(f"\n{'='*60}")
     logger.info("ALL TASKS COMPLETED")
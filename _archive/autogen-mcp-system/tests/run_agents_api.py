@@ -4,6 +4,7 @@ This allows HTTP requests to trigger agent tasks
 """
 
 from fastapi import FastAPI, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
 from agents.orchestrator import AgentOrchestrator
 from mcp_server.auth import verify_credentials
@@ -11,11 +12,23 @@ from utils.logging_config import setup_logging
 from loguru import logger
 import uvicorn
 import asyncio
+import json
+from contextlib import asynccontextmanager
 
 setup_logging()
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Release the shared orchestrator's teams and model client on shutdown"""
+    yield
+    await orchestrator.aclose()
+
+
 app = FastAPI(
-    title="Agent Execution API", description="Trigger data analysis tasks via HTTP"
+    title="Agent Execution API",
+    description="Trigger data analysis tasks via HTTP",
+    lifespan=lifespan,
 )
 
 
@@ -78,6 +91,29 @@ async def execute_agent_task(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.post("/execute-task/stream")
+async def execute_agent_task_stream(
+    request: TaskRequest, user_info: dict = Depends(verify_credentials)
+):
+    """
+    Execute an agent task, streaming agent messages as server-sent events
+
+    Requires LDAP authentication
+    """
+    logger.info(
+        f"Streamed task request from {user_info['username']}: {request.task_description}"
+    )
+
+    async def events():
+        async for event in orchestrator.execute_task_stream(
+            task_description=request.task_description,
+            username=user_info["username"],
+        ):
+            yield f"data: {json.dumps(event)}\n\n"
+
+    return StreamingResponse(events(), media_type="text/event-stream")
+
+
 @app.get("/health")
 async def health():
     """Health check"""
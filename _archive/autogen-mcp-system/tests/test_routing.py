@@ -0,0 +1,55 @@
+"""
+Routing regression checks for the task classifier (agents.enhanced_orchestrator.classify_task)
+
+Runs under pytest, or directly: python -m tests.test_routing
+
+NOTE: needs the full environment (config/.env and a reachable MS SQL Server).
+Importing agents.enhanced_orchestrator creates mcp_server.database.db, which
+connects at import time and re-raises if it can't - until that connect is made
+lazy this test can't run without the database.
+"""
+
+from agents.enhanced_orchestrator import classify_task
+
+DATA = "DATA_ANALYSIS_TEAM"
+GENERAL = "GENERAL_ASSISTANT_TEAM"
+
+# AdventureWorksDW identifiers and inflections must keep reaching the data team
+DATA_TASKS = [
+    "What is the row count of DimCustomer?",
+    "What is the total of FactInternetSales?",
+    "Summarize DimProduct",
+    "What is the average SalesAmount?",
+    "What is the sum of UnitPrice in FactInternetSales?",
+    "What is total revenues in 2023?",
+    "sql",
+    "SELECT TOP 10 * FROM DimCustomer",
+    "WITH recent AS (SELECT * FROM FactInternetSales) SELECT COUNT(*) FROM recent",
+    "How many customers bought bikes?",
+]
+
+GENERAL_TASKS = [
+    "hi",
+    "thanks",
+    "What is 15% of 200?",
+    "Convert 5 miles to kilometers",
+    # Starts with a SQL keyword but is plain English
+    "With a 20% tip, how much is $45?",
+    "Select the best option for a 3 day trip",
+]
+
+
+def test_data_tasks_route_to_data_team():
+    for task in DATA_TASKS:
+        assert classify_task(task) == DATA, task
+
+
+def test_general_tasks_route_to_general_team():
+    for task in GENERAL_TASKS:
+        assert classify_task(task) == GENERAL, task
+
+
+if __name__ == "__main__":
+    test_data_tasks_route_to_data_team()
+    test_general_tasks_route_to_general_team()
+    print("✓ Routing checks passed")
@@ -4,13 +4,22 @@
 # ============================================================
 
 from autogen_ext.models.ollama import OllamaChatCompletionClient
+from ollama import AsyncClient
 from config.settings import settings
 from loguru import logger
 from datetime import datetime, timedelta
 import json
+import re
 from pathlib import Path
 
 
+# Rate-limit wording seen in Ollama / upstream cloud model errors
+_RATE_LIMIT_RE = re.compile(
+    r"rate limit|too many requests|429|quota exceeded|limit exceeded|throttle",
+    re.IGNORECASE,
+)
+
+
 class ModelManager:
     """
     Manages model selection with automatic fallback
@@ -35,6 +44,13 @@ class ModelManager:
         self.failure_count = 0
         self.failure_threshold = 3  # Switch after 3 failures
         
+        # One client per model, shared by every orchestrator in the process
+        self._clients = {}
+        
+        # Raw Ollama client for housekeeping calls (model warm-up); created once
+        # and reused so each call doesn't leave an httpx pool behind
+        self._ollama = AsyncClient(host=settings.ollama_host)
+        
         self.usage_file = Path("logs/model_usage.json")
         self.usage_file.parent.mkdir(exist_ok=True)
         
@@ -66,17 +82,42 @@ class ModelManager:
         
         logger.debug(f"🎯 Using model: {model_to_use} (fallback={self.using_fallback})")
         
-        # Create client
-        client = OllamaChatCompletionClient(
-            model=model_to_use,
-            base_url=settings.ollama_host,
-            temperature=0.7,
-            max_tokens=2000,
-            model_info=settings.ollama_model_info if model_to_use == self.primary_model else None
-        )
+        # Reuse the client (and its HTTP connection pool) if already built
+        client = self._clients.get(model_to_use)
+        if client is None:
+            client = OllamaChatCompletionClient(
+                model=model_to_use,
+                base_url=settings.ollama_host,
+                temperature=0.7,
+                max_tokens=2000,
+                keep_alive=settings.ollama_keep_alive,
+                model_info=settings.ollama_model_info if model_to_use == self.primary_model else None
+            )
+            self._clients[model_to_use] = client
         
         return client
     
+    async def warm_up_fallback(self):
+        """
+        Load the fallback model into Ollama ahead of time
+        
+        An empty prompt makes Ollama load the model without generating, so the
+        first switch to fallback doesn't pay the model load inside a failing request.
+        """
+        
+        if not settings.enable_fallback:
+            return
+        
+        try:
+            await self._ollama.generate(
+                model=self.fallback_model,
+                prompt="",
+                keep_alive=settings.ollama_keep_alive,
+            )
+            logger.info(f"🔥 Fallback model warmed up: {self.fallback_model}")
+        except Exception as e:
+            logger.warning(f"⚠️ Could not warm up fallback model {self.fallback_model}: {e}")
+    
     def handle_model_error(self, error: Exception) -> bool:
         """
         Handle model execution error
@@ -88,19 +129,12 @@ class ModelManager:
             True if switched to fallback, False otherwise
         """
         
-        error_str = str(error).lower()
-        
-        # Check for rate limit indicators
-        rate_limit_keywords = [
-            "rate limit",
-            "too many requests",
-            "429",
-            "quota exceeded",
-            "limit exceeded",
-            "throttle"
-        ]
+        # Typed check first: ollama.ResponseError carries the HTTP status
+        is_rate_limit = getattr(error, "status_code", None) == 429
         
-        is_rate_limit = any(keyword in error_str for keyword in rate_limit_keywords)
+        # Fall back to the message text for errors without a status code
+        if not is_rate_limit:
+            is_rate_limit = _RATE_LIMIT_RE.search(str(error)) is not None
         
         if is_rate_limit:
             logger.warning(f"🚨 Rate limit detected: {error}")
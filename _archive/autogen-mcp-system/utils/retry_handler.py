@@ -1,3 +1,5 @@
+import random
+import time
 from typing import Dict, Any, Callable
 from loguru import logger
 from config.settings import settings
@@ -6,6 +8,10 @@ from config.settings import settings
 class QueryRetryHandler:
     """Handles query retry logic with escalation"""
 
+    # Backoff between attempts: full jitter over min(cap, base * 2**attempt) seconds
+    BACKOFF_BASE_SECONDS = 1.0
+    BACKOFF_CAP_SECONDS = 10.0
+
     def __init__(self, max_attempts: int = None):
         self.max_attempts = max_attempts or settings.agent_retry_attempts
 
@@ -30,10 +36,23 @@ class QueryRetryHandler:
                 last_error = result.get("error", "Unknown error")
                 logger.warning(f"Attempt {attempt} failed: {last_error}")
 
+                # Rejected before reaching the database - retrying won't change it
+                if "error_type" not in result:
+                    return result
+
             except Exception as e:
                 last_error = str(e)
                 logger.error(f"Attempt {attempt} exception: {last_error}")
 
+            # Capped, jittered wait so retries don't hammer a struggling server
+            if attempt < self.max_attempts:
+                delay = random.uniform(
+                    0,
+                    min(self.BACKOFF_CAP_SECONDS, self.BACKOFF_BASE_SECONDS * 2**attempt),
+                )
+                logger.info(f"Retrying in {delay:.1f}s")
+                time.sleep(delay)
+
         # All attempts exhausted
         logger.error(f"All {self.max_attempts} attempts failed. Escalating to human.")
         return {